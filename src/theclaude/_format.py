@@ -0,0 +1,12 @@
+"""Shared formatting helpers."""
+
+
+def format_size(size_bytes: int) -> str:
+    """Human readable size (B/KB/MB/GB/TB)."""
+    if size_bytes < 1024:
+        return f"{size_bytes}B"
+
+    # Pick the unit from the bit length instead of a division ladder,
+    # clamped so petabyte-and-up sizes render as a large TB figure
+    unit = min((size_bytes.bit_length() - 1) // 10, 4)
+    return f"{size_bytes / (1 << (unit * 10)):.1f}{'BKMGT'[unit]}B"
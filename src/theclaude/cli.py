@@ -1,19 +1,21 @@
 """CLI interface for The Claude file recovery tool."""
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt, Confirm
-from rich.text import Text
 from collections import Counter
 
+from ._format import format_size
 from .models import FileRecord, ProjectSummary
-from .scanner import LogScanner
-from .recovery import FileRecovery
+
+# Heavy imports (rich.table/panel/prompt pull in markup parsing, the
+# scanner/recovery modules pull in more of rich) are deferred into the
+# commands that need them to keep bare startup fast
+if TYPE_CHECKING:
+    from .scanner import LogScanner
 
 app = typer.Typer(
     name="theclaude",
@@ -22,6 +24,14 @@ app = typer.Typer(
 )
 console = Console()
 
+# Colors for operation types in the scan table
+_OP_STYLES = {
+    "Write": "green",
+    "Read": "blue",
+    "Edit": "yellow",
+    "MultiEdit": "orange1"
+}
+
 
 @app.command()
 def projects(
@@ -32,8 +42,13 @@ def projects(
     )
 ) -> None:
     """List all Claude Code projects and their recoverable files."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from .scanner import LogScanner
+
     scanner = LogScanner(claude_dir or Path.home() / ".claude")
-    
+
     console.print(Panel.fit("🦾 The Claude - Claude Code Projects", style="bold blue"))
     
     project_paths = scanner.find_projects()
@@ -50,9 +65,15 @@ def projects(
     table.add_column("Size", justify="right", style="yellow")
     table.add_column("Last Activity", style="blue")
     
-    for project_path in project_paths:
-        summary = scanner.get_project_summary(project_path)
-        
+    # Projects are independent and summary generation is parse-bound,
+    # so fan the work out across cores
+    if len(project_paths) > 1:
+        with ProcessPoolExecutor() as executor:
+            summaries = list(executor.map(scanner.get_project_summary, project_paths))
+    else:
+        summaries = [scanner.get_project_summary(p) for p in project_paths]
+
+    for summary in summaries:
         last_activity = "Never" if summary.latest_activity is None else summary.latest_activity.strftime("%Y-%m-%d")
         
         table.add_row(
@@ -90,54 +111,67 @@ def scan(
         "--type",
         "-t",
         help="Filter by file type (Python, JavaScript, etc.)"
+    ),
+    count_only: bool = typer.Option(
+        False,
+        "--count-only",
+        help="Only show file counts and totals, skip the table"
     )
 ) -> None:
     """Scan a specific project for recoverable files."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from .scanner import LogScanner
+
     scanner = LogScanner(claude_dir or Path.home() / ".claude")
-    
+
     # Find matching project
     project_path = _find_project(scanner, project)
     if not project_path:
         return
-    
+
     console.print(Panel.fit(f"🔍 Scanning {project} for recoverable files", style="bold green"))
-    
-    files = scanner.scan_project_for_files(project_path)
-    
-    # Apply filters
-    if file_type:
-        files = [f for f in files if f.file_type.lower() == file_type.lower()]
-    
-    if not files:
+
+    # Stream records: aggregate stats in one pass, but only keep `limit`
+    # records around for the table instead of materializing everything
+    total_files = 0
+    total_size = 0
+    type_counts = Counter()
+    version_count = 0
+    files: List[FileRecord] = []
+
+    for file_record in scanner.scan_project_for_files(project_path, file_type=file_type):
+        total_files += 1
+        total_size += file_record.size_bytes
+        type_counts[file_record.file_type] += 1
+        if file_record.version_count > 1:
+            version_count += 1
+        if len(files) < limit:
+            files.append(file_record)
+
+    if not total_files:
         if file_type:
             console.print(f"❌ No {file_type} files found in this project!")
         else:
             console.print("❌ No recoverable files found in this project!")
         return
-    
+
     # Show enhanced summary with file type breakdown
-    total_size = sum(f.size_bytes for f in files)
-    if total_size < 1024:
-        size_str = f"{total_size}B"
-    elif total_size < 1024 * 1024:
-        size_str = f"{total_size / 1024:.1f}KB"
-    else:
-        size_str = f"{total_size / (1024 * 1024):.1f}MB"
-    
-    # Count file types
-    type_counts = Counter(f.file_type for f in files)
+    size_str = format_size(total_size)
+
     type_breakdown = ", ".join([f"{count} {ftype}" for ftype, count in type_counts.most_common(3)])
-    
-    # Count versions
-    version_files = [f for f in files if hasattr(f, '_version_count')]
-    
-    console.print(f"📊 Found {len(files)} recoverable files ({size_str} total)")
+
+    console.print(f"📊 Found {total_files} recoverable files ({size_str} total)")
     if type_breakdown:
         console.print(f"📁 File types: {type_breakdown}")
-    if version_files:
-        console.print(f"🔄 {len(version_files)} files have multiple versions")
+    if version_count:
+        console.print(f"🔄 {version_count} files have multiple versions")
     console.print()
-    
+
+    if count_only:
+        return
+
     # Show files table
     table = Table(title="💾 Recoverable Files")
     table.add_column("#", width=3, justify="right", style="dim")
@@ -150,7 +184,7 @@ def scan(
     table.add_column("Date", style="blue")
     table.add_column("Conversation", style="dim", no_wrap=True)
     
-    for i, file_record in enumerate(files[:limit], 1):
+    for i, file_record in enumerate(files, 1):
         # Use project-relative path for cleaner display
         display_path = file_record.relative_path
         
@@ -163,28 +197,20 @@ def scan(
             else:
                 display_path = f"{parent_path}/{filename}"
         
-        # Color code operation types
-        op_style = {
-            "Write": "green",
-            "Read": "blue", 
-            "Edit": "yellow",
-            "MultiEdit": "orange1"
-        }.get(file_record.operation_type, "white")
-        
-        operation = Text(file_record.operation_type, style=op_style)
-        
+        # Color code operation types via Rich markup; plain styled strings
+        # avoid allocating Text objects per row
+        op_style = _OP_STYLES.get(file_record.operation_type, "white")
+        operation = f"[{op_style}]{file_record.operation_type}[/]"
+
         # Add version indicator if file has multiple versions with highlighting
-        file_type_display = file_record.file_type
-        if hasattr(file_record, '_version_count'):
-            version_text = f" ({file_record._version_count}v)"
-            file_type_display = Text(file_record.file_type)
-            file_type_display.append(version_text, style="bold yellow")
+        if file_record.version_count > 1:
+            file_type_display = f"{file_record.file_type}[bold yellow] ({file_record.version_count}v)[/]"
         else:
             file_type_display = file_record.file_type
-        
+
         # Create colored size text
-        size_text = Text(file_record.size_human, style=file_record.size_color)
-        
+        size_text = f"[{file_record.size_color}]{file_record.size_human}[/]"
+
         row_data = [
             str(i),
             display_path,
@@ -211,8 +237,8 @@ def scan(
     
     console.print(table)
     
-    if len(files) > limit:
-        console.print(f"... and {len(files) - limit} more files")
+    if total_files > limit:
+        console.print(f"... and {total_files - limit} more files")
     
     console.print()
     console.print("💡 Use 'theclaude recover <project>' to recover files")
@@ -267,6 +293,12 @@ def recover(
     )
 ) -> None:
     """Recover files from a Claude Code project."""
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+
+    from .recovery import FileRecovery
+    from .scanner import LogScanner
+
     scanner = LogScanner(claude_dir or Path.home() / ".claude")
     recovery = FileRecovery(create_backups=not no_backups)
     
@@ -276,9 +308,9 @@ def recover(
         return
     
     console.print(Panel.fit(f"🦾 Recovering files from {project}", style="bold green"))
-    
-    files = scanner.scan_project_for_files(project_path)
-    
+
+    files = list(scanner.scan_project_for_files(project_path))
+
     if not files:
         console.print("❌ No recoverable files found in this project!")
         return
@@ -297,14 +329,8 @@ def recover(
     
     # Confirm recovery
     if not force and not interactive:
-        total_size = sum(f.size_bytes for f in files)
-        if total_size < 1024:
-            size_str = f"{total_size}B"
-        elif total_size < 1024 * 1024:
-            size_str = f"{total_size / 1024:.1f}KB"
-        else:
-            size_str = f"{total_size / (1024 * 1024):.1f}MB"
-        
+        size_str = format_size(sum(f.size_bytes for f in files))
+
         if not Confirm.ask(f"Recover {len(files)} files ({size_str}) to {target_dir}?"):
             console.print("❌ Recovery cancelled!")
             return
@@ -313,59 +339,71 @@ def recover(
     console.print("🚀 Starting recovery...")
     results = recovery.recover_files(files, target_dir, preserve_structure, force)
     
-    # Show detailed recovery report
-    successful = [r for r in results if r.success]
-    failed = [r for r in results if not r.success]
-    backed_up = [r for r in successful if r.backup_created]
-    
+    # Show detailed recovery report, gathered in a single pass over results
+    success_count = 0
+    backup_count = 0
+    total_recovered_size = 0
+    type_counts = Counter()
+    failed = []
+
+    for result in results:
+        if result.success:
+            success_count += 1
+            total_recovered_size += result.file_record.size_bytes
+            type_counts[result.file_record.file_type] += 1
+            if result.backup_created:
+                backup_count += 1
+        else:
+            failed.append(result)
+
     console.print()
     console.print(Panel.fit(
-        f"🎉 Recovery Complete: {len(successful)} succeeded, {len(failed)} failed",
-        style="bold green" if len(failed) == 0 else "bold yellow"
+        f"🎉 Recovery Complete: {success_count} succeeded, {len(failed)} failed",
+        style="bold green" if not failed else "bold yellow"
     ))
-    
+
     # Recovery statistics
-    if successful:
-        total_recovered_size = sum(r.file_record.size_bytes for r in successful)
-        if total_recovered_size < 1024:
-            size_str = f"{total_recovered_size}B"
-        elif total_recovered_size < 1024 * 1024:
-            size_str = f"{total_recovered_size / 1024:.1f}KB"
-        else:
-            size_str = f"{total_recovered_size / (1024 * 1024):.1f}MB"
-        
-        type_counts = Counter(r.file_record.file_type for r in successful)
+    if success_count:
+        size_str = format_size(total_recovered_size)
         top_types = type_counts.most_common(3)
-        
+
         console.print(f"📊 Recovered {size_str} across {len(type_counts)} file types")
         if top_types:
             type_list = ", ".join([f"{count} {ftype}" for ftype, count in top_types])
             console.print(f"📁 Types: {type_list}")
-        
-        if backed_up:
-            console.print(f"💾 Created {len(backed_up)} backup files")
+
+        if backup_count:
+            console.print(f"💾 Created {backup_count} backup files")
     
     if failed:
-        console.print("❌ Failed recoveries:")
-        for result in failed:
-            console.print(f"   {result.file_record.file_name}: {result.error_message}")
+        console.print('\n'.join(
+            ["❌ Failed recoveries:"]
+            + [f"   {result.file_record.file_name}: {result.error_message}" for result in failed]
+        ))
 
 
-def _find_project(scanner: LogScanner, project: str) -> Optional[Path]:
+def _find_project(scanner: "LogScanner", project: str) -> Optional[Path]:
     """Find a project by name or partial match."""
-    project_paths = scanner.find_projects()
-    
+    from rich.prompt import Prompt
+
+    # Extract each candidate's name once, shared by both matching passes
+    named = [
+        (path, scanner._extract_project_name(path.name))
+        for path in scanner.find_projects()
+    ]
+
     # Exact match first
-    for path in project_paths:
-        if scanner._extract_project_name(path.name) == project:
+    for path, project_name in named:
+        if project_name == project:
             return path
-    
+
     # Partial match
-    matches = []
-    for path in project_paths:
-        project_name = scanner._extract_project_name(path.name)
-        if project.lower() in project_name.lower():
-            matches.append((path, project_name))
+    project_lower = project.lower()
+    matches = [
+        (path, project_name)
+        for path, project_name in named
+        if project_lower in project_name.lower()
+    ]
     
     if not matches:
         console.print(f"❌ No project found matching '{project}'")
@@ -390,18 +428,23 @@ def _find_project(scanner: LogScanner, project: str) -> Optional[Path]:
 
 def _interactive_file_selection(files: List[FileRecord]) -> List[FileRecord]:
     """Let user interactively select which files to recover."""
+    from rich.prompt import Prompt
+
     console.print("📁 Select files to recover:")
     console.print("   (Enter numbers separated by commas, 'all' for all files, or 'q' to quit)")
     console.print()
     
-    # Show numbered list
+    # Show numbered list, built up front and emitted in one print so Rich
+    # formats and flushes once instead of per file
+    lines = []
     for i, file_record in enumerate(files, 1):
         display_path = file_record.file_path
         if len(display_path) > 80:
             display_path = "..." + display_path[-77:]
-        
-        console.print(f"  {i:2d}. {display_path} ({file_record.size_human}, {file_record.operation_type})")
-    
+
+        lines.append(f"  {i:2d}. {display_path} ({file_record.size_human}, {file_record.operation_type})")
+
+    console.print('\n'.join(lines))
     console.print()
     
     while True:
@@ -1,64 +1,139 @@
 """Data models for file recovery operations."""
 
+import json
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Literal, Optional, Dict, List
 from collections import Counter
 
+from ._format import format_size
 
-@dataclass
+# Common project root indicators, built once at import time
+_PROJECT_INDICATORS = frozenset({
+    'src', 'lib', 'app', 'components', 'pages', 'api', 'utils', 'tests', 'docs'
+})
+
+# Extension -> human-readable type, built once at import time
+_EXT_TYPE_MAP = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.jsx': 'React',
+    '.tsx': 'React TS',
+    '.html': 'HTML',
+    '.css': 'CSS',
+    '.scss': 'SCSS',
+    '.json': 'JSON',
+    '.yaml': 'YAML',
+    '.yml': 'YAML',
+    '.toml': 'TOML',
+    '.md': 'Markdown',
+    '.txt': 'Text',
+    '.sql': 'SQL',
+    '.sh': 'Shell',
+    '.dockerfile': 'Docker',
+    '.rs': 'Rust',
+    '.go': 'Go',
+    '.java': 'Java',
+    '.php': 'PHP',
+    '.rb': 'Ruby',
+    '.c': 'C',
+    '.cpp': 'C++',
+    '.h': 'Header',
+}
+
+
+# Inverse map: lowercased type name -> extensions, for O(1) type filters
+_type_to_exts_builder: Dict[str, set] = {}
+for _ext, _file_type in _EXT_TYPE_MAP.items():
+    _type_to_exts_builder.setdefault(_file_type.lower(), set()).add(_ext)
+_TYPE_TO_EXTS: Dict[str, frozenset] = {
+    t: frozenset(exts) for t, exts in _type_to_exts_builder.items()
+}
+del _type_to_exts_builder
+
+
+@dataclass(slots=True)
 class FileRecord:
-    """Represents a recoverable file found in conversation logs."""
-    
+    """Represents a recoverable file found in conversation logs.
+
+    Content is not normally held in memory: the scanner records where the
+    file came from (conversation log + byte offset) and load_content()
+    re-reads the log line on demand. Metadata-only commands (projects,
+    scan without --preview) therefore never pay for content storage.
+
+    Slotted, so instances carry no __dict__; the derived properties below
+    are cheap enough to recompute on access instead of being cached.
+    """
+
     file_path: str
-    content: str
     operation_type: Literal["Write", "Read", "Edit", "MultiEdit"]
     timestamp: datetime
     conversation_id: str
     project_name: str
     size_bytes: int
-    
+    version_count: int = 1
+    content: Optional[str] = None
+    first_line: str = ''
+    source_file: Optional[Path] = None
+    source_offset: int = -1
+
+    def load_content(self) -> str:
+        """Return file content, re-reading the conversation log if needed."""
+        if self.content is None:
+            self.content = self._read_content_from_source()
+        return self.content
+
+    def _read_content_from_source(self) -> str:
+        """Re-read this record's content from its conversation log line."""
+        if self.source_file is None or self.source_offset < 0:
+            raise ValueError(f"No content source recorded for {self.file_path}")
+
+        with open(self.source_file, 'rb') as f:
+            f.seek(self.source_offset)
+            entry = json.loads(f.readline())
+
+        if self.operation_type == "Read":
+            return entry['toolUseResult']['file']['content']
+
+        for content_item in entry['message']['content']:
+            if (content_item.get('type') == 'tool_use'
+                    and content_item.get('name') == self.operation_type
+                    and content_item.get('input', {}).get('file_path') == self.file_path):
+                return content_item['input']['content']
+
+        raise ValueError(f"Content for {self.file_path} not found in {self.source_file}")
+
     @property
     def file_name(self) -> str:
         """Get just the filename from the full path."""
-        return Path(self.file_path).name
+        return self.file_path[self.file_path.rfind('/') + 1:]
     
     @property
     def relative_path(self) -> str:
         """Get path relative to project root if possible."""
-        path = Path(self.file_path)
-        
         # Try to make it relative to common project structures
-        parts = path.parts
-        
+        parts = self.file_path.split('/')
+
         # Look for common project root indicators
-        project_indicators = [
-            'src', 'lib', 'app', 'components', 'pages', 'api', 'utils', 'tests', 'docs'
-        ]
-        
         for i, part in enumerate(parts):
-            if part in project_indicators and i > 0:
+            if part in _PROJECT_INDICATORS and i > 0:
                 # Take everything from the indicator onwards
-                return str(Path(*parts[i:]))
-        
+                return '/'.join(parts[i:])
+
         # If no project structure found, try to get last 2-3 meaningful parts
         if len(parts) > 3:
-            return str(Path(*parts[-3:]))
+            return '/'.join(parts[-3:])
         elif len(parts) > 1:
-            return str(Path(*parts[-2:]))
-        
-        return path.name
+            return '/'.join(parts[-2:])
+
+        return self.file_name
     
     @property
     def size_human(self) -> str:
         """Human readable file size."""
-        if self.size_bytes < 1024:
-            return f"{self.size_bytes}B"
-        elif self.size_bytes < 1024 * 1024:
-            return f"{self.size_bytes / 1024:.1f}KB"
-        else:
-            return f"{self.size_bytes / (1024 * 1024):.1f}MB"
+        return format_size(self.size_bytes)
     
     @property
     def size_color(self) -> str:
@@ -78,54 +153,38 @@ class FileRecord:
     @property
     def file_extension(self) -> str:
         """Get file extension for categorization."""
-        return Path(self.file_path).suffix.lower()
-    
+        dot = self.file_path.rfind('.')
+        slash = self.file_path.rfind('/')
+        if dot <= slash + 1:  # No dot in the filename (or dotfile like .bashrc)
+            return ''
+        return self.file_path[dot:].lower()
+
     @property
     def file_type(self) -> str:
         """Get human-readable file type."""
-        ext = self.file_extension
-        type_map = {
-            '.py': 'Python',
-            '.js': 'JavaScript', 
-            '.ts': 'TypeScript',
-            '.jsx': 'React',
-            '.tsx': 'React TS',
-            '.html': 'HTML',
-            '.css': 'CSS',
-            '.scss': 'SCSS',
-            '.json': 'JSON',
-            '.yaml': 'YAML',
-            '.yml': 'YAML',
-            '.toml': 'TOML',
-            '.md': 'Markdown',
-            '.txt': 'Text',
-            '.sql': 'SQL',
-            '.sh': 'Shell',
-            '.dockerfile': 'Docker',
-            '.rs': 'Rust',
-            '.go': 'Go',
-            '.java': 'Java',
-            '.php': 'PHP',
-            '.rb': 'Ruby',
-            '.c': 'C',
-            '.cpp': 'C++',
-            '.h': 'Header',
-        }
-        return type_map.get(ext, 'Other')
+        return _EXT_TYPE_MAP.get(self.file_extension, 'Other')
     
+    @property
+    def content_bytes(self) -> bytes:
+        """UTF-8 encoded content, loading it from the source log if needed."""
+        return self.load_content().encode('utf-8')
+
     @property
     def preview_lines(self) -> List[str]:
-        """Get first 5 lines of content for preview."""
-        lines = self.content.split('\n')
-        return lines[:5]
-    
+        """Get first lines of content for preview."""
+        if self.content is not None:
+            # Cap the split so multi-MB contents aren't fully split for a preview
+            return self.content.split('\n', 5)[:5]
+        # Without loaded content, the scanner-captured first line is enough
+        return [self.first_line] if self.first_line else []
+
     @property
     def line_count(self) -> int:
         """Get total number of lines."""
-        return len(self.content.split('\n'))
+        return self.load_content().count('\n') + 1
 
 
-@dataclass 
+@dataclass(slots=True)
 class ProjectSummary:
     """Summary of a Claude Code project and its recoverable files."""
     
@@ -140,12 +199,7 @@ class ProjectSummary:
     @property
     def size_human(self) -> str:
         """Human readable total size."""
-        if self.total_size_bytes < 1024:
-            return f"{self.total_size_bytes}B"
-        elif self.total_size_bytes < 1024 * 1024:
-            return f"{self.total_size_bytes / 1024:.1f}KB"
-        else:
-            return f"{self.total_size_bytes / (1024 * 1024):.1f}MB"
+        return format_size(self.total_size_bytes)
     
     @property
     def file_breakdown(self) -> str:
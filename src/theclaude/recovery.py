@@ -1,16 +1,26 @@
 """File recovery engine for restoring files from conversation logs."""
 
+import os
 import shutil
+import stat
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
 from rich.console import Console
 from rich.prompt import Confirm
 
+from ._format import format_size
 from .models import FileRecord, RecoveryResult
 
 console = Console()
 
+# Common project root indicators for rebuilding relative paths, built once
+_RECOVERY_INDICATORS = frozenset({
+    'src', 'lib', 'app', '.claude', 'tests', 'docs'
+})
+
 
 class FileRecovery:
     """Handles recovery of files from conversation logs to disk."""
@@ -19,18 +29,20 @@ class FileRecovery:
         self.create_backups = create_backups
     
     def recover_file(
-        self, 
-        file_record: FileRecord, 
+        self,
+        file_record: FileRecord,
         target_path: Optional[Path] = None,
-        force: bool = False
+        force: bool = False,
+        quiet: bool = False
     ) -> RecoveryResult:
         """Recover a single file to disk.
-        
+
         Args:
             file_record: The file record to recover
             target_path: Custom target path (defaults to original path)
             force: If True, overwrite existing files without prompting
-            
+            quiet: If True, don't print per-file progress (for batch workers)
+
         Returns:
             RecoveryResult with success status and details
         """
@@ -61,17 +73,41 @@ class FileRecovery:
             
             # Create backup if file exists and backups are enabled
             if was_existing and self.create_backups:
-                backup_path = target_path.with_suffix(target_path.suffix + '.backup')
-                shutil.copy2(target_path, backup_path)
+                backup_path = target_path.with_name(target_path.name + '.backup')
+                try:
+                    # Hard link copies nothing when backup and original share a filesystem
+                    backup_path.unlink(missing_ok=True)
+                    os.link(target_path, backup_path)
+                except OSError:
+                    shutil.copy2(target_path, backup_path)
                 backup_created = True
-                console.print(f"💾 Created backup: {backup_path}")
-            
-            # Write the recovered content
-            with open(target_path, 'w', encoding='utf-8') as f:
-                f.write(file_record.content)
-            
-            console.print(f"✅ Recovered: {target_path}")
-            
+                if not quiet:
+                    console.print(f"💾 Created backup: {backup_path}")
+
+            # Write the recovered content in one encode pass and one write.
+            # When the target existed, write to a temp file and rename over it
+            # so a hard-linked backup keeps pointing at the old inode. The
+            # temp name is unique (mkstemp) so an unrelated foo.tmp survives,
+            # and the original mode is copied so exec bits aren't stripped.
+            if was_existing:
+                mode = stat.S_IMODE(target_path.stat().st_mode)
+                fd, tmp_name = tempfile.mkstemp(
+                    dir=target_path.parent, prefix=target_path.name + '.', suffix='.tmp'
+                )
+                try:
+                    with os.fdopen(fd, 'wb') as tmp_file:
+                        tmp_file.write(file_record.content_bytes)
+                    os.chmod(tmp_name, mode)
+                    os.replace(tmp_name, target_path)
+                except Exception:
+                    os.unlink(tmp_name)
+                    raise
+            else:
+                target_path.write_bytes(file_record.content_bytes)
+
+            if not quiet:
+                console.print(f"✅ Recovered: {target_path}")
+
             return RecoveryResult(
                 file_record=file_record,
                 success=True,
@@ -108,8 +144,9 @@ class FileRecovery:
         Returns:
             List of RecoveryResult objects
         """
-        results = []
-        
+        # Collapse records mapping to the same target path so each file is
+        # written (and backed up) once, keeping the newest version
+        latest: dict = {}
         for file_record in file_records:
             if target_dir is not None:
                 if preserve_structure:
@@ -121,34 +158,52 @@ class FileRecovery:
                     target_path = target_dir / Path(file_record.file_path).name
             else:
                 target_path = None
-            
-            result = self.recover_file(file_record, target_path, force)
-            results.append(result)
-            
+
+            key = target_path if target_path is not None else Path(file_record.file_path)
+            existing = latest.get(key)
+            if existing is None or file_record.timestamp > existing[0].timestamp:
+                latest[key] = (file_record, target_path)
+
+        work = list(latest.values())
+
+        if force and len(work) > 1:
+            # No prompts possible with force, so overlap the writes; syscalls
+            # release the GIL and dominate each recovery
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(
+                    lambda item: self.recover_file(item[0], item[1], force=True, quiet=True),
+                    work
+                ))
+            # Report from the main thread to keep console output ordered
+            for result in results:
+                if result.success:
+                    if result.backup_created:
+                        console.print(f"💾 Created backup: {result.target_path}.backup")
+                    console.print(f"✅ Recovered: {result.target_path}")
+        else:
+            results = []
+            for file_record, target_path in work:
+                results.append(self.recover_file(file_record, target_path, force))
+
+        for result in results:
             if not result.success:
-                console.print(f"❌ Failed to recover {file_record.file_path}: {result.error_message}")
-        
+                console.print(f"❌ Failed to recover {result.file_record.file_path}: {result.error_message}")
+
         return results
     
     def _make_relative_path(self, file_path: str) -> Path:
         """Convert absolute path to relative path for recovery."""
-        path = Path(file_path)
-        
         # Try to make it relative to common project structures
-        parts = path.parts
-        
+        parts = file_path.split('/')
+
         # Look for common project root indicators
-        project_indicators = [
-            'src', 'lib', 'app', '.claude', 'tests', 'docs'
-        ]
-        
         for i, part in enumerate(parts):
-            if part in project_indicators and i > 0:
+            if part in _RECOVERY_INDICATORS and i > 0:
                 # Take everything from the parent of the indicator
                 return Path(*parts[i-1:])
-        
+
         # If no project structure found, just take the filename
-        return Path(path.name)
+        return Path(parts[-1])
     
     def preview_recovery(
         self, 
@@ -159,7 +214,8 @@ class FileRecovery:
         """Preview what would be recovered without actually doing it."""
         console.print("🔍 Recovery Preview:")
         console.print()
-        
+
+        targets = []
         for file_record in file_records:
             if target_dir is not None:
                 if preserve_structure:
@@ -169,17 +225,28 @@ class FileRecovery:
                     target_path = target_dir / Path(file_record.file_path).name
             else:
                 target_path = Path(file_record.file_path)
-            
-            status = "📝 NEW" if not target_path.exists() else "⚠️  OVERWRITE"
-            console.print(f"{status} {target_path} ({file_record.size_human})")
-        
+
+            targets.append((file_record, target_path))
+
+        # One scandir per distinct parent directory instead of a stat call
+        # per file; most records cluster into a handful of directories
+        existing: dict = {}
+        for _, target_path in targets:
+            parent = target_path.parent
+            if parent not in existing:
+                try:
+                    with os.scandir(parent) as entries:
+                        existing[parent] = {entry.name for entry in entries}
+                except OSError:
+                    existing[parent] = set()
+
+        lines = []
+        for file_record, target_path in targets:
+            status = "📝 NEW" if target_path.name not in existing[target_path.parent] else "⚠️  OVERWRITE"
+            lines.append(f"{status} {target_path} ({file_record.size_human})")
+
+        console.print('\n'.join(lines))
         console.print()
         console.print(f"Total files: {len(file_records)}")
         total_size = sum(f.size_bytes for f in file_records)
-        if total_size < 1024:
-            size_str = f"{total_size}B"
-        elif total_size < 1024 * 1024:
-            size_str = f"{total_size / 1024:.1f}KB"
-        else:
-            size_str = f"{total_size / (1024 * 1024):.1f}MB"
-        console.print(f"Total size: {size_str}")
\ No newline at end of file
+        console.print(f"Total size: {format_size(total_size)}")
\ No newline at end of file
@@ -1,18 +1,173 @@
 """Scanner for Claude Code conversation logs to find recoverable files."""
 
 import json
-from datetime import datetime
+import mmap
+import os
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from io import BytesIO
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterator, List, Optional
+from typing import Iterator, List, Optional, Union
 
 from rich.console import Console
 from rich.progress import Progress, TaskID
 
-from .models import FileRecord, ProjectSummary
-from collections import Counter, defaultdict
+from .models import FileRecord, ProjectSummary, _EXT_TYPE_MAP, _TYPE_TO_EXTS
+from collections import Counter
+
+# orjson parses JSONL lines several times faster than stdlib json; fall
+# back silently when it isn't installed (pip install theclaude[speed])
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# msgspec goes a step further: its Decoder compiles a parser specialized
+# to the conversation-entry schema below, skipping every field the
+# scanner never reads. Preferred over orjson when both are installed.
+try:
+    import msgspec
+
+    class _EntryContent(msgspec.Struct):
+        """One item of message.content; non-tool items leave the defaults."""
+        type: str = ''
+        name: str = ''
+        input: Optional[dict] = None
+
+    class _EntryMessage(msgspec.Struct):
+        content: Union[List[_EntryContent], str, None] = None
+
+    class _Entry(msgspec.Struct):
+        type: str = ''
+        timestamp: str = ''
+        message: Optional[_EntryMessage] = None
+        toolUseResult: Union[dict, str, list, None] = None
+
+    _entry_decoder: Optional['msgspec.json.Decoder'] = msgspec.json.Decoder(_Entry)
+    _DecodeError = msgspec.DecodeError
+except ImportError:
+    _entry_decoder = None
+    _DecodeError = ValueError
 
 console = Console()
 
+# Read conversation logs in large chunks; per-line reads spend most of
+# their time in buffer negotiation rather than parsing
+_CHUNK_SIZE = 256 * 1024
+
+# Files at least this big are mmapped so the kernel pages them instead of
+# the scanner copying them through read buffers
+_MMAP_THRESHOLD = 1024 * 1024
+
+
+# On-disk scan index: old conversations are immutable once closed, so
+# their parsed records survive between invocations keyed by file stat
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    path TEXT PRIMARY KEY,
+    mtime INTEGER,
+    size INTEGER,
+    records BLOB
+)
+"""
+
+
+def _records_to_blob(records: List[FileRecord]) -> bytes:
+    """Serialize scan records (metadata only, content stays lazy)."""
+    return json.dumps([
+        {
+            'file_path': r.file_path,
+            'operation_type': r.operation_type,
+            'timestamp': r.timestamp.isoformat(),
+            'conversation_id': r.conversation_id,
+            'project_name': r.project_name,
+            'size_bytes': r.size_bytes,
+            'first_line': r.first_line,
+            'source_file': str(r.source_file) if r.source_file else None,
+            'source_offset': r.source_offset,
+        }
+        for r in records
+    ]).encode('utf-8')
+
+
+def _records_from_blob(blob: bytes) -> List[FileRecord]:
+    """Deserialize scan records stored by _records_to_blob."""
+    # Interning matches what the scan path does: records deserialized from
+    # the index share one copy of each repeated string
+    return [
+        FileRecord(
+            file_path=sys.intern(item['file_path']),
+            operation_type=sys.intern(item['operation_type']),
+            timestamp=datetime.fromisoformat(item['timestamp']),
+            conversation_id=sys.intern(item['conversation_id']),
+            project_name=sys.intern(item['project_name']),
+            size_bytes=item['size_bytes'],
+            first_line=item['first_line'],
+            source_file=Path(item['source_file']) if item['source_file'] else None,
+            source_offset=item['source_offset'],
+        )
+        for item in _loads(blob)
+    ]
+
+
+def _stat_and_read(path: Path) -> tuple:
+    """Read a file's bytes with an mtime taken before the read.
+
+    Stamping caches with a post-read stat would cover bytes appended
+    between read-EOF and the stat; pairing the pre-read mtime with the
+    length actually read keeps any such append visible as growth.
+    """
+    mtime_ns = path.stat().st_mtime_ns
+    return mtime_ns, path.read_bytes()
+
+
+def _utf8_len(content: str) -> int:
+    """UTF-8 byte length without allocating an encoded copy for ASCII text.
+
+    Sizes are computed eagerly at scan time on purpose: records don't
+    retain their content, so deferring this would mean re-reading and
+    re-parsing the conversation log just to render a size column. isascii
+    is a flag check on CPython, making the common case effectively free.
+    """
+    return len(content) if content.isascii() else len(content.encode('utf-8'))
+
+
+def _iter_mmap_lines(mm) -> Iterator[tuple]:
+    """Yield (byte_offset, line) pairs from a memory-mapped file."""
+    start = 0
+    end = len(mm)
+    while start < end:
+        newline = mm.find(b'\n', start)
+        if newline == -1:
+            yield start, mm[start:end]
+            break
+        yield start, mm[start:newline]
+        start = newline + 1
+
+
+def _iter_lines_with_offsets(f, offset: int = 0) -> Iterator[tuple]:
+    """Yield (byte_offset, line) pairs from a binary stream, chunk by chunk.
+
+    offset names the stream's current position so yielded offsets stay
+    absolute when resuming partway through a file.
+    """
+    tail = b''
+    while True:
+        chunk = f.read(_CHUNK_SIZE)
+        if not chunk:
+            break
+        lines = (tail + chunk).split(b'\n')
+        tail = lines.pop()
+        for line in lines:
+            yield offset, line
+            offset += len(line) + 1
+    if tail:
+        yield offset, tail
+
 
 class LogScanner:
     """Scans Claude Code conversation logs for recoverable files."""
@@ -20,23 +175,181 @@ class LogScanner:
     def __init__(self, claude_dir: Path = Path.home() / ".claude"):
         self.claude_dir = claude_dir
         self.projects_dir = claude_dir / "projects"
-    
+        # Per-file scan results keyed by path -> (mtime_ns, size, records),
+        # shared between summaries and full scans so the common
+        # "projects then scan/recover" flow only parses each file once
+        self._file_scan_cache: dict = {}
+        # Per-project .jsonl listings, so find_projects / summary / scan
+        # read each project directory at most once per invocation
+        self._conversation_file_cache: dict = {}
+
+    def __getstate__(self):
+        # Pool workers re-scan exactly the files that missed this cache, so
+        # pickling it per task would ship every cached record list to every
+        # worker for nothing. The listing cache stays: it's a few paths and
+        # saves workers a scandir.
+        state = self.__dict__.copy()
+        state['_file_scan_cache'] = {}
+        return state
+
+    def _index_connect(self) -> Optional[sqlite3.Connection]:
+        """Open the persistent scan index, or None if it's unavailable.
+
+        Connections are opened per operation rather than held on the
+        instance so the scanner stays picklable for pool workers.
+        """
+        try:
+            conn = sqlite3.connect(self.claude_dir / ".theclaude_index.sqlite", timeout=5)
+            conn.execute(_INDEX_SCHEMA)
+            return conn
+        except sqlite3.Error:
+            return None
+
+    def _cached_records(self, jsonl_file: Path) -> Optional[List[FileRecord]]:
+        """Return cached records for a file, tail-scanning appended lines.
+
+        Conversation logs are append-only while a session is live: when a
+        cached file has only grown, just the new bytes are parsed and
+        merged with the cached records. Scans always run to end of file,
+        so the cached size doubles as the resume offset.
+        """
+        try:
+            stat = jsonl_file.stat()
+        except OSError:
+            return None
+
+        entry = self._file_scan_cache.get(jsonl_file)
+        if entry is None:
+            # Fall back to the on-disk index from previous invocations
+            conn = self._index_connect()
+            if conn is not None:
+                try:
+                    row = conn.execute(
+                        "SELECT mtime, size, records FROM scans WHERE path = ?",
+                        (str(jsonl_file),)
+                    ).fetchone()
+                    if row is not None:
+                        entry = (row[0], row[1], _records_from_blob(row[2]))
+                except (sqlite3.Error, KeyError, ValueError, TypeError):
+                    pass  # Corrupt or incompatible index entries just mean a rescan
+                finally:
+                    conn.close()
+
+        if entry is None:
+            return None
+
+        mtime_ns, size, records = entry
+        if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+            self._file_scan_cache[jsonl_file] = entry
+            return records
+
+        # File grew (live session appending): parse only the new tail.
+        # A shrunken or rewritten file falls through to a full rescan.
+        # The stamp pairs the pre-read stat's mtime with the offset the
+        # tail parse consumed, so appends racing this scan stay uncovered.
+        if 0 < size < stat.st_size:
+            tail = self._scan_appended_lines(jsonl_file, size)
+            if tail is not None:
+                tail_records, end_offset = tail
+                merged = records + tail_records
+                self._store_records(jsonl_file, merged, (stat.st_mtime_ns, end_offset))
+                return merged
+
+        return None
+
+    def _scan_appended_lines(self, jsonl_file: Path, start_offset: int) -> Optional[tuple]:
+        """Parse only the bytes appended past start_offset.
+
+        Returns (records, end_offset) where end_offset is the byte the
+        parse actually consumed up to, or None when the previous scan
+        ended mid-line (no trailing newline), in which case the caller
+        should rescan the whole file.
+        """
+        try:
+            with open(jsonl_file, 'rb', buffering=0) as f:
+                f.seek(start_offset - 1)
+                if f.read(1) != b'\n':
+                    return None
+                records = list(self._parse_conversation_lines(
+                    _iter_lines_with_offsets(f, offset=start_offset),
+                    jsonl_file,
+                    sys.intern(jsonl_file.stem),
+                    sys.intern(self._extract_project_name(jsonl_file.parent.name))
+                ))
+                return records, f.tell()
+        except OSError:
+            return None
+
+    def _store_records(
+        self, jsonl_file: Path, records: List[FileRecord], stamp: tuple
+    ) -> None:
+        """Cache scan results for a file under a (mtime_ns, size) stamp.
+
+        The stamp must describe the bytes the records were actually
+        parsed from — mtime from before the read, size as consumed by
+        the parse — never a stat taken afterwards: logs are append-only
+        during live sessions, and a post-parse stat would mark appended
+        lines as covered, making the freshness check and the tail-scan
+        resume silently skip them forever.
+        """
+        mtime_ns, size = stamp
+        self._file_scan_cache[jsonl_file] = (mtime_ns, size, records)
+
+        conn = self._index_connect()
+        if conn is not None:
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO scans (path, mtime, size, records) VALUES (?, ?, ?, ?)",
+                    (str(jsonl_file), mtime_ns, size, _records_to_blob(records))
+                )
+                conn.commit()
+            except sqlite3.Error:
+                pass  # The index is an optimization; scans still work without it
+            finally:
+                conn.close()
+
     def find_projects(self) -> List[Path]:
         """Find all Claude Code project directories."""
         if not self.projects_dir.exists():
             console.print(f"❌ Claude projects directory not found: {self.projects_dir}")
             return []
         
+        # scandir gives file types from the directory entries themselves, and
+        # the listings it produces are cached so downstream summary/scan
+        # calls never re-glob the same directories
         projects = []
-        for item in self.projects_dir.iterdir():
-            if item.is_dir() and any(item.glob("*.jsonl")):
-                projects.append(item)
-        
+        with os.scandir(self.projects_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                project_path = Path(entry.path)
+                conversation_files = self._conversation_files(project_path)
+                if conversation_files:
+                    projects.append(project_path)
+
         return sorted(projects)
+
+    def _conversation_files(self, project_path: Path) -> List[Path]:
+        """List a project's .jsonl logs, reading each directory only once."""
+        cached = self._conversation_file_cache.get(project_path)
+        if cached is not None:
+            return cached
+
+        try:
+            with os.scandir(project_path) as children:
+                conversation_files = sorted(
+                    Path(child.path) for child in children
+                    if child.name.endswith('.jsonl') and child.is_file()
+                )
+        except OSError:
+            conversation_files = []
+
+        self._conversation_file_cache[project_path] = conversation_files
+        return conversation_files
     
     def get_project_summary(self, project_path: Path) -> ProjectSummary:
         """Get summary information for a project."""
-        conversation_files = list(project_path.glob("*.jsonl"))
+        conversation_files = self._conversation_files(project_path)
         
         # Quick scan to count files and get latest activity
         file_count = 0
@@ -44,21 +357,49 @@ class LogScanner:
         latest_activity = None
         file_types = Counter()
         
+        def _accumulate(files: List[FileRecord]) -> None:
+            nonlocal file_count, total_size, latest_activity
+            file_count += len(files)
+            for file_record in files:
+                total_size += file_record.size_bytes
+                file_types[file_record.file_type] += 1
+                if latest_activity is None or file_record.timestamp > latest_activity:
+                    latest_activity = file_record.timestamp
+
+        # Serve unchanged files from the scan cache; only the rest hit disk.
+        # Cached records get the same per-file error handling as scans so a
+        # bad entry persisted in the index degrades to a warning, not a crash
+        to_scan = []
         for conv_file in conversation_files:
-            try:
-                files = list(self._scan_conversation_for_files(conv_file))
-                file_count += len(files)
-                
-                for file_record in files:
-                    total_size += file_record.size_bytes
-                    file_types[file_record.file_type] += 1
-                    if latest_activity is None or file_record.timestamp > latest_activity:
-                        latest_activity = file_record.timestamp
-                        
-            except Exception as e:
-                console.print(f"⚠️  Error scanning {conv_file.name}: {e}")
-                continue
-        
+            records = self._cached_records(conv_file)
+            if records is not None:
+                try:
+                    _accumulate(records)
+                except Exception as e:
+                    console.print(f"⚠️  Error scanning {conv_file.name}: {e}")
+            else:
+                to_scan.append(conv_file)
+
+        if to_scan:
+            # Read ahead on a single worker thread so the next file's I/O
+            # overlaps with parsing the current one
+            with ThreadPoolExecutor(max_workers=1) as reader:
+                next_read = reader.submit(_stat_and_read, to_scan[0])
+
+                for i, conv_file in enumerate(to_scan):
+                    read = next_read
+                    if i + 1 < len(to_scan):
+                        next_read = reader.submit(_stat_and_read, to_scan[i + 1])
+
+                    try:
+                        mtime_ns, data = read.result()
+                        files = self._scan_conversation_data(conv_file, data)
+                        self._store_records(conv_file, files, (mtime_ns, len(data)))
+                        _accumulate(files)
+                    except Exception as e:
+                        console.print(f"⚠️  Error scanning {conv_file.name}: {e}")
+                        continue
+
         return ProjectSummary(
             name=self._extract_project_name(project_path.name),
             path=project_path,
@@ -69,137 +410,360 @@ class LogScanner:
             file_types=file_types
         )
     
-    def scan_project_for_files(self, project_path: Path) -> List[FileRecord]:
-        """Scan all conversations in a project for recoverable files."""
-        conversation_files = list(project_path.glob("*.jsonl"))
-        all_files = []
-        
+    def scan_project_for_files(
+        self, project_path: Path, file_type: Optional[str] = None
+    ) -> Iterator[FileRecord]:
+        """Scan all conversations in a project for recoverable files.
+
+        Yields deduplicated records newest-first. If file_type is given,
+        records are filtered before the version-grouping pass so callers
+        never see (or pay for) non-matching files.
+        """
+        conversation_files = self._conversation_files(project_path)
+
+        # Best-so-far per path, folded straight into collection so only one
+        # record per file path is ever held (records are metadata-only, but
+        # heavy histories still produce far more versions than paths)
+        best: dict = {}
+        version_counts: Counter = Counter()
+
+        # Resolve the type filter to an extension set once, so the per-record
+        # check is a frozenset lookup instead of string comparisons
+        wanted_exts = None
+        match_other = False
+        if file_type:
+            wanted_type = file_type.lower()
+            if wanted_type == 'other':
+                match_other = True
+            else:
+                wanted_exts = _TYPE_TO_EXTS.get(wanted_type, frozenset())
+
         with Progress() as progress:
             task = progress.add_task(
-                f"Scanning {self._extract_project_name(project_path.name)}...", 
+                f"Scanning {self._extract_project_name(project_path.name)}...",
                 total=len(conversation_files)
             )
-            
+
+            def _collect(conv_file: Path, records: List[FileRecord]) -> None:
+                for file_record in records:
+                    if match_other:
+                        if file_record.file_extension in _EXT_TYPE_MAP:
+                            continue
+                    elif wanted_exts is not None and file_record.file_extension not in wanted_exts:
+                        continue
+                    version_counts[file_record.file_path] += 1
+                    current = best.get(file_record.file_path)
+                    if current is None or file_record.timestamp > current.timestamp:
+                        best[file_record.file_path] = file_record
+
+            # Serve unchanged files straight from the scan cache. Cache hits
+            # fly by, so advance the bar once for the whole batch instead of
+            # taking the render lock per file
+            to_scan = []
+            cache_hits = 0
             for conv_file in conversation_files:
-                try:
-                    files = list(self._scan_conversation_for_files(conv_file))
-                    all_files.extend(files)
-                except Exception as e:
-                    console.print(f"⚠️  Error scanning {conv_file.name}: {e}")
-                finally:
-                    progress.advance(task)
-        
-        # Group by file path to detect versions, keeping the most recent as primary
-        file_versions = defaultdict(list)
-        for file_record in all_files:
-            file_versions[file_record.file_path].append(file_record)
-        
-        # For each file, sort versions by timestamp and keep the latest
-        final_files = []
-        for file_path, versions in file_versions.items():
-            versions.sort(key=lambda f: f.timestamp, reverse=True)
-            latest = versions[0]
-            
-            # Add version info to the latest record
-            if len(versions) > 1:
-                # Monkey patch version count (could make this a proper field later)
-                latest._version_count = len(versions)
-            
-            final_files.append(latest)
-        
-        return sorted(final_files, key=lambda f: f.timestamp, reverse=True)
+                records = self._cached_records(conv_file)
+                if records is not None:
+                    try:
+                        _collect(conv_file, records)
+                    except Exception as e:
+                        console.print(f"⚠️  Error scanning {conv_file.name}: {e}")
+                    cache_hits += 1
+                else:
+                    to_scan.append(conv_file)
+            if cache_hits:
+                progress.advance(task, cache_hits)
+
+            if len(to_scan) > 1:
+                # Conversation files parse independently and JSON decoding is
+                # CPU-bound, so fan the per-file scans out across processes
+                with ProcessPoolExecutor() as executor:
+                    futures = {
+                        executor.submit(self._scan_conversation_file, conv_file): conv_file
+                        for conv_file in to_scan
+                    }
+                    for future in as_completed(futures):
+                        conv_file = futures[future]
+                        try:
+                            records, stamp = future.result()
+                            self._store_records(conv_file, records, stamp)
+                            _collect(conv_file, records)
+                        except Exception as e:
+                            console.print(f"⚠️  Error scanning {conv_file.name}: {e}")
+                        finally:
+                            progress.advance(task)
+            else:
+                for conv_file in to_scan:
+                    try:
+                        records, stamp = self._scan_conversation_file(conv_file)
+                        self._store_records(conv_file, records, stamp)
+                        _collect(conv_file, records)
+                    except Exception as e:
+                        console.print(f"⚠️  Error scanning {conv_file.name}: {e}")
+                    finally:
+                        progress.advance(task)
+
+        for file_path, file_record in best.items():
+            file_record.version_count = version_counts[file_path]
+
+        yield from sorted(best.values(), key=lambda f: f.timestamp, reverse=True)
     
-    def _scan_conversation_for_files(self, jsonl_file: Path) -> Iterator[FileRecord]:
-        """Scan a single conversation log file for file operations."""
-        project_name = self._extract_project_name(jsonl_file.parent.name)
-        conversation_id = jsonl_file.stem
-        
-        with open(jsonl_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                try:
-                    entry = json.loads(line)
-                    
-                    # Look for file operations in tool use
-                    if entry.get('type') == 'assistant' and 'message' in entry:
-                        message = entry['message']
-                        
-                        if 'content' in message and isinstance(message['content'], list):
-                            timestamp = self._parse_timestamp(entry.get('timestamp', ''))
-                            
-                            for content_item in message['content']:
-                                if content_item.get('type') == 'tool_use':
-                                    file_record = self._extract_file_from_tool_use(
-                                        content_item, timestamp, conversation_id, project_name
-                                    )
-                                    if file_record:
-                                        yield file_record
-                    
-                    # Look for file content in tool results  
-                    if entry.get('type') == 'user' and 'toolUseResult' in entry:
-                        result = entry['toolUseResult']
-                        if isinstance(result, dict) and result.get('type') == 'text':
-                            file_info = result.get('file', {})
-                            if 'filePath' in file_info and 'content' in file_info:
-                                timestamp = self._parse_timestamp(entry.get('timestamp', ''))
-                                yield FileRecord(
-                                    file_path=file_info['filePath'],
-                                    content=file_info['content'], 
-                                    operation_type="Read",
-                                    timestamp=timestamp,
-                                    conversation_id=conversation_id,
-                                    project_name=project_name,
-                                    size_bytes=len(file_info['content'].encode('utf-8'))
+    def _scan_conversation_file(self, jsonl_file: Path) -> tuple:
+        """Scan one conversation log file for file operations.
+
+        Returns (records, stamp) — picklable, for pool workers — where
+        stamp is (mtime_ns, parsed_size) with the mtime taken before any
+        bytes are read and the size being what the parse consumed, so
+        lines appended mid-scan can't be stamped as already covered.
+
+        Records don't retain file content: each carries its log file and
+        byte offset so FileRecord.load_content() can re-read on demand.
+        """
+        # Interned: every record from this file shares these exact strings
+        project_name = sys.intern(self._extract_project_name(jsonl_file.parent.name))
+        conversation_id = sys.intern(jsonl_file.stem)
+
+        # Unbuffered: _iter_lines_with_offsets already reads _CHUNK_SIZE at a
+        # time, so BufferedReader would only add an extra copy per chunk
+        with open(jsonl_file, 'rb', buffering=0) as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size >= _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    records = list(self._parse_conversation_lines(
+                        _iter_mmap_lines(mm), jsonl_file, conversation_id, project_name
+                    ))
+                    parsed_size = len(mm)
+            else:
+                records = list(self._parse_conversation_lines(
+                    _iter_lines_with_offsets(f), jsonl_file, conversation_id, project_name
+                ))
+                parsed_size = f.tell()
+
+        return records, (stat.st_mtime_ns, parsed_size)
+
+    def _scan_conversation_data(self, jsonl_file: Path, data: bytes) -> List[FileRecord]:
+        """Scan a conversation file whose bytes were already read."""
+        return list(self._parse_conversation_lines(
+            _iter_lines_with_offsets(BytesIO(data)),
+            jsonl_file,
+            jsonl_file.stem,
+            self._extract_project_name(jsonl_file.parent.name)
+        ))
+
+    def _parse_conversation_lines(
+        self,
+        lines: Iterator[tuple],
+        jsonl_file: Path,
+        conversation_id: str,
+        project_name: str
+    ) -> Iterator[FileRecord]:
+        """Parse (offset, line) pairs from a conversation log into records."""
+        if _entry_decoder is not None:
+            yield from self._parse_conversation_lines_msgspec(
+                lines, jsonl_file, conversation_id, project_name
+            )
+            return
+
+        # Bind hot names to locals: after orjson, per-line global and method
+        # lookups are a real fraction of the loop, and the loop runs once
+        # per log line across every conversation in a project
+        loads = _loads
+        parse_timestamp = _parse_timestamp
+        extract_tool_use = self._extract_file_from_tool_use
+
+        for line_offset, line in lines:
+            # Most entries carry no file operations at all; a substring probe
+            # is far cheaper than parsing the line just to discard it
+            if b'tool_use' not in line and b'toolUseResult' not in line:
+                continue
+
+            try:
+                entry = loads(line)
+                entry_type = entry.get('type')
+
+                # Look for file operations in tool use
+                if entry_type == 'assistant' and 'message' in entry:
+                    message = entry['message']
+
+                    if 'content' in message and isinstance(message['content'], list):
+                        timestamp = parse_timestamp(entry.get('timestamp', ''))
+
+                        for content_item in message['content']:
+                            if content_item.get('type') == 'tool_use':
+                                file_record = extract_tool_use(
+                                    content_item, timestamp, conversation_id, project_name,
+                                    jsonl_file, line_offset
                                 )
-                                
-                except (json.JSONDecodeError, KeyError, TypeError) as e:
-                    # Skip malformed entries
-                    continue
-    
-    def _extract_file_from_tool_use(
-        self, 
-        tool_use: dict, 
-        timestamp: datetime, 
-        conversation_id: str, 
+                                if file_record:
+                                    yield file_record
+
+                # Look for file content in tool results
+                elif entry_type == 'user' and 'toolUseResult' in entry:
+                    result = entry['toolUseResult']
+                    if isinstance(result, dict) and result.get('type') == 'text':
+                        file_info = result.get('file', {})
+                        if 'filePath' in file_info and 'content' in file_info:
+                            timestamp = parse_timestamp(entry.get('timestamp', ''))
+                            content = file_info['content']
+                            yield FileRecord(
+                                file_path=sys.intern(file_info['filePath']),
+                                operation_type="Read",
+                                timestamp=timestamp,
+                                conversation_id=conversation_id,
+                                project_name=project_name,
+                                size_bytes=_utf8_len(content),
+                                first_line=content.split('\n', 1)[0],
+                                source_file=jsonl_file,
+                                source_offset=line_offset
+                            )
+
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                # Skip malformed entries
+                continue
+
+    def _parse_conversation_lines_msgspec(
+        self,
+        lines: Iterator[tuple],
+        jsonl_file: Path,
+        conversation_id: str,
         project_name: str
+    ) -> Iterator[FileRecord]:
+        """Schema-specialized variant of _parse_conversation_lines.
+
+        The compiled decoder only materializes the handful of fields the
+        structs declare, so everything else in an entry is skipped inside
+        msgspec's C parser rather than built into dicts and discarded here.
+        """
+        decode = _entry_decoder.decode
+        parse_timestamp = _parse_timestamp
+        extract_tool_use = self._extract_file_from_tool_use
+
+        for line_offset, line in lines:
+            if b'tool_use' not in line and b'toolUseResult' not in line:
+                continue
+
+            try:
+                entry = decode(line)
+
+                if entry.type == 'assistant' and entry.message is not None:
+                    content_items = entry.message.content
+                    if isinstance(content_items, list):
+                        timestamp = parse_timestamp(entry.timestamp)
+
+                        for content_item in content_items:
+                            if content_item.type == 'tool_use':
+                                file_record = extract_tool_use(
+                                    {'name': content_item.name,
+                                     'input': content_item.input or {}},
+                                    timestamp, conversation_id, project_name,
+                                    jsonl_file, line_offset
+                                )
+                                if file_record:
+                                    yield file_record
+
+                elif entry.type == 'user':
+                    result = entry.toolUseResult
+                    if isinstance(result, dict) and result.get('type') == 'text':
+                        file_info = result.get('file', {})
+                        if 'filePath' in file_info and 'content' in file_info:
+                            timestamp = parse_timestamp(entry.timestamp)
+                            content = file_info['content']
+                            yield FileRecord(
+                                file_path=sys.intern(file_info['filePath']),
+                                operation_type="Read",
+                                timestamp=timestamp,
+                                conversation_id=conversation_id,
+                                project_name=project_name,
+                                size_bytes=_utf8_len(content),
+                                first_line=content.split('\n', 1)[0],
+                                source_file=jsonl_file,
+                                source_offset=line_offset
+                            )
+
+            except (_DecodeError, KeyError, TypeError):
+                # Skip malformed entries
+                continue
+
+    def _extract_file_from_tool_use(
+        self,
+        tool_use: dict,
+        timestamp: datetime,
+        conversation_id: str,
+        project_name: str,
+        source_file: Path,
+        source_offset: int
     ) -> Optional[FileRecord]:
         """Extract file information from a tool use entry."""
         tool_name = tool_use.get('name', '')
         tool_input = tool_use.get('input', {})
-        
+
         if tool_name == 'Write' and 'file_path' in tool_input and 'content' in tool_input:
+            content = tool_input['content']
             return FileRecord(
-                file_path=tool_input['file_path'],
-                content=tool_input['content'],
-                operation_type="Write", 
+                # Interned: versions of the same file share one path string,
+                # and the dedup loop groups records by it
+                file_path=sys.intern(tool_input['file_path']),
+                operation_type="Write",
                 timestamp=timestamp,
                 conversation_id=conversation_id,
                 project_name=project_name,
-                size_bytes=len(tool_input['content'].encode('utf-8'))
+                size_bytes=_utf8_len(content),
+                first_line=content.split('\n', 1)[0],
+                source_file=source_file,
+                source_offset=source_offset
             )
-        
+
         elif tool_name == 'Edit' and 'file_path' in tool_input:
             # For edits, we'd need to reconstruct the file, which is complex
             # For now, skip Edit operations as they're harder to recover
             return None
-            
+
         elif tool_name == 'MultiEdit' and 'file_path' in tool_input:
             # Similar to Edit, MultiEdit is complex to reconstruct
             return None
-            
+
         return None
     
     def _extract_project_name(self, directory_name: str) -> str:
         """Extract a human-readable project name from directory name."""
-        # Claude Code creates directories like "-Users-rudy-development-projects-myproject"
-        if directory_name.startswith('-'):
-            parts = directory_name.split('-')
-            if len(parts) > 1:
-                return parts[-1]  # Take the last part as project name
-        return directory_name
-    
+        return _extract_project_name(directory_name)
+
     def _parse_timestamp(self, timestamp_str: str) -> datetime:
         """Parse ISO timestamp string into datetime."""
-        try:
-            return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        except (ValueError, AttributeError):
-            return datetime.now()  # Fallback to current time
\ No newline at end of file
+        return _parse_timestamp(timestamp_str)
+
+
+@lru_cache(maxsize=256)
+def _extract_project_name(directory_name: str) -> str:
+    """Extract a human-readable project name from directory name."""
+    # Claude Code creates directories like "-Users-rudy-development-projects-myproject"
+    if directory_name.startswith('-'):
+        parts = directory_name.split('-')
+        if len(parts) > 1:
+            return parts[-1]  # Take the last part as project name
+    return directory_name
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp_cached(timestamp_str: str) -> datetime:
+    """Parse ISO timestamp string into datetime; raises if it can't."""
+    # fromisoformat accepts the trailing 'Z' directly on Python 3.11+,
+    # so the common case needs no intermediate string
+    try:
+        return datetime.fromisoformat(timestamp_str)
+    except ValueError:
+        return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+
+
+def _parse_timestamp(timestamp_str: str) -> datetime:
+    """Parse ISO timestamp string into datetime.
+
+    The fallback is tz-aware like every successfully parsed log
+    timestamp, so naive/aware comparison errors can't arise downstream,
+    and it stays outside the cache (lru_cache doesn't cache raises) so
+    malformed timestamps don't all share one frozen "now".
+    """
+    try:
+        return _parse_timestamp_cached(timestamp_str)
+    except (ValueError, TypeError, AttributeError):
+        return datetime.now(timezone.utc)  # Fallback to current time
\ No newline at end of file
@@ -0,0 +1,144 @@
+"""Tests for the conversation log scanner's index and content round-trip."""
+
+import json
+
+import pytest
+
+from theclaude.scanner import LogScanner
+
+
+def _write_entry(file_path: str, content: str, timestamp: str) -> str:
+    """Build one conversation log line containing a Write tool use."""
+    return json.dumps({
+        "type": "assistant",
+        "timestamp": timestamp,
+        "message": {
+            "content": [
+                {
+                    "type": "tool_use",
+                    "name": "Write",
+                    "input": {"file_path": file_path, "content": content},
+                }
+            ]
+        },
+    })
+
+
+@pytest.fixture
+def claude_dir(tmp_path):
+    """A fake ~/.claude with one project directory."""
+    project_dir = tmp_path / "projects" / "-Users-rudy-myproject"
+    project_dir.mkdir(parents=True)
+    return tmp_path
+
+
+def test_scan_index_round_trip(claude_dir):
+    """Records survive the on-disk index and still load exact content."""
+    project_dir = claude_dir / "projects" / "-Users-rudy-myproject"
+    content_v1 = "print('v1')\n"
+    content_v2 = "print('v2')\nsecond line\n"
+    (project_dir / "conv.jsonl").write_text(
+        _write_entry("/x/src/main.py", content_v1, "2026-08-30T10:00:00Z")
+        + "\n"
+        + _write_entry("/x/src/main.py", content_v2, "2026-08-30T12:00:00Z")
+        + "\n"
+    )
+
+    scanner = LogScanner(claude_dir=claude_dir)
+    records = list(scanner.scan_project_for_files(project_dir))
+    assert len(records) == 1
+    assert records[0].version_count == 2
+    assert records[0].load_content() == content_v2
+
+    # A fresh scanner must serve the same records from the sqlite index,
+    # and load_content() must still find the right log line by offset
+    reopened = LogScanner(claude_dir=claude_dir)
+    cached = list(reopened.scan_project_for_files(project_dir))
+    assert len(cached) == 1
+    assert cached[0].version_count == 2
+    assert cached[0].load_content() == content_v2
+
+
+def test_tail_scan_merges_appended_lines(claude_dir):
+    """Appending to a scanned log parses only the tail, not a full rescan."""
+    project_dir = claude_dir / "projects" / "-Users-rudy-myproject"
+    conv_file = project_dir / "conv.jsonl"
+    conv_file.write_text(
+        _write_entry("/x/src/a.py", "a = 1\n", "2026-08-30T10:00:00Z") + "\n"
+    )
+
+    scanner = LogScanner(claude_dir=claude_dir)
+    assert len(list(scanner.scan_project_for_files(project_dir))) == 1
+
+    appended = "a = 2\nnew version\n"
+    with open(conv_file, "a") as f:
+        f.write(_write_entry("/x/src/a.py", appended, "2026-08-30T11:00:00Z") + "\n")
+        f.write(_write_entry("/x/src/b.py", "b\n", "2026-08-30T11:30:00Z") + "\n")
+
+    reopened = LogScanner(claude_dir=claude_dir)
+    # Poison the full-scan path: a grown file must be served by tail-scan
+    reopened._scan_conversation_file = None
+    records = {r.file_path: r for r in reopened.scan_project_for_files(project_dir)}
+    assert set(records) == {"/x/src/a.py", "/x/src/b.py"}
+    assert records["/x/src/a.py"].version_count == 2
+    assert records["/x/src/a.py"].load_content() == appended
+
+
+def test_append_racing_the_store_stays_uncovered(claude_dir):
+    """Lines appended between read and store must not be stamped as scanned."""
+    project_dir = claude_dir / "projects" / "-Users-rudy-myproject"
+    conv_file = project_dir / "conv.jsonl"
+    conv_file.write_text(
+        _write_entry("/x/src/a.py", "a\n", "2026-08-30T10:00:00Z") + "\n"
+    )
+
+    from theclaude.scanner import _stat_and_read
+
+    scanner = LogScanner(claude_dir=claude_dir)
+    mtime_ns, data = _stat_and_read(conv_file)
+    records = scanner._scan_conversation_data(conv_file, data)
+    # Append lands after the read but before the store, like a live session
+    with open(conv_file, "a") as f:
+        f.write(_write_entry("/x/src/b.py", "b\n", "2026-08-30T11:00:00Z") + "\n")
+    scanner._store_records(conv_file, records, (mtime_ns, len(data)))
+
+    reopened = LogScanner(claude_dir=claude_dir)
+    found = {r.file_path for r in reopened.scan_project_for_files(project_dir)}
+    assert found == {"/x/src/a.py", "/x/src/b.py"}
+
+
+def test_truncated_file_triggers_full_rescan(claude_dir):
+    """A shrunken log invalidates the index entry instead of merging."""
+    project_dir = claude_dir / "projects" / "-Users-rudy-myproject"
+    conv_file = project_dir / "conv.jsonl"
+    conv_file.write_text(
+        _write_entry("/x/src/a.py", "a\n", "2026-08-30T10:00:00Z") + "\n"
+        + _write_entry("/x/src/b.py", "b\n", "2026-08-30T11:00:00Z") + "\n"
+    )
+
+    scanner = LogScanner(claude_dir=claude_dir)
+    assert len(list(scanner.scan_project_for_files(project_dir))) == 2
+
+    conv_file.write_text(
+        _write_entry("/x/src/c.py", "c\n", "2026-08-30T12:00:00Z") + "\n"
+    )
+    reopened = LogScanner(claude_dir=claude_dir)
+    records = list(reopened.scan_project_for_files(project_dir))
+    assert [r.file_path for r in records] == ["/x/src/c.py"]
+
+
+def test_mmap_path_preserves_offsets(claude_dir):
+    """Files over the mmap threshold still yield offsets load_content trusts."""
+    project_dir = claude_dir / "projects" / "-Users-rudy-myproject"
+    padding = json.dumps({"type": "user", "note": "x" * 4000})
+    content = "target = True\n" + "data\n" * 10
+    lines = [padding] * 300  # ~1.2MB of non-matching entries
+    lines.append(_write_entry("/x/src/big.py", content, "2026-08-30T10:00:00Z"))
+    conv_file = project_dir / "conv.jsonl"
+    conv_file.write_text("\n".join(lines) + "\n")
+    assert conv_file.stat().st_size >= 1024 * 1024
+
+    scanner = LogScanner(claude_dir=claude_dir)
+    records = list(scanner.scan_project_for_files(project_dir))
+    assert len(records) == 1
+    assert records[0].load_content() == content